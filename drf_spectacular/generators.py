@@ -13,9 +13,9 @@ from drf_spectacular.drainage import (
 from drf_spectacular.extensions import OpenApiViewExtension
 from drf_spectacular.openapi import AutoSchema
 from drf_spectacular.plumbing import (
-    ComponentRegistry, alpha_operation_sorter, build_root_object, camelize_operation, get_class,
-    is_versioning_supported, modify_for_versioning, normalize_result_object,
-    operation_matches_version, process_webhooks, sanitize_result_object,
+    ComponentRegistry, _follow_field_source_cached, alpha_operation_sorter, build_root_object,
+    camelize_operation, get_class, is_versioning_supported, modify_for_versioning,
+    normalize_result_object, operation_matches_version, process_webhooks, sanitize_result_object,
 )
 from drf_spectacular.settings import spectacular_settings
 
@@ -281,6 +281,7 @@ class SchemaGenerator(BaseSchemaGenerator):
     def get_schema(self, request=None, public=False):
         """ Generate a OpenAPI schema. """
         reset_generator_stats()
+        _follow_field_source_cached.cache_clear()
         result = build_root_object(
             paths=self.parse(request, public),
             components=self.registry.build(spectacular_settings.APPEND_COMPONENTS),
@@ -118,7 +118,8 @@ def get_class(obj) -> type:
 def force_instance(serializer_or_field):
     if not inspect.isclass(serializer_or_field):
         return serializer_or_field
-    elif issubclass(serializer_or_field, (serializers.BaseSerializer, fields.Field)):
+    elif issubclass(serializer_or_field, fields.Field):
+        # BaseSerializer is a subclass of Field
         return serializer_or_field()
     else:
         return serializer_or_field
@@ -128,7 +129,10 @@ def is_serializer(obj, strict=False) -> TypeGuard[_SerializerType]:
 
     from drf_spectacular.extensions import OpenApiSerializerExtension
     return (
-        isinstance(force_instance(obj), serializers.BaseSerializer)
+        (
+            issubclass(obj, serializers.BaseSerializer)
+            if inspect.isclass(obj) else isinstance(obj, serializers.BaseSerializer)
+        )
         or (bool(OpenApiSerializerExtension.get_match(obj)) and not strict)
     )
 
@@ -156,7 +160,10 @@ def is_basic_serializer(obj: Any) -> TypeGuard[_SerializerType]:
 def is_field(obj: Any) -> TypeGuard[_FieldType]:
     # make sure obj is a serializer field and nothing else.
     # guard against serializers because BaseSerializer(Field)
-    return isinstance(force_instance(obj), fields.Field) and not is_serializer(obj)
+    return (
+        issubclass(obj, fields.Field)
+        if inspect.isclass(obj) else isinstance(obj, fields.Field)
+    ) and not is_serializer(obj)
 
 
 def is_basic_type(obj: Any, allow_none=True) -> TypeGuard[_KnownPythonTypes]:
@@ -164,7 +171,7 @@ def is_basic_type(obj: Any, allow_none=True) -> TypeGuard[_KnownPythonTypes]:
         return False
     if not allow_none and (obj is None or obj is OpenApiTypes.NONE):
         return False
-    return obj in get_openapi_type_mapping() or obj in PYTHON_TYPE_MAPPING
+    return obj in get_basic_type_mapping()
 
 
 def is_patched_serializer(serializer, direction) -> bool:
@@ -242,16 +249,11 @@ def get_doc(obj) -> str:
     if not inspect.isclass(obj):
         return post_cleanup(inspect.getdoc(obj) or '')
 
-    def safe_index(lst, item):
-        try:
-            return lst.index(item)
-        except ValueError:
-            return len(lst)
-
-    lib_barrier = min(
-        safe_index(obj.__mro__, c) for c in spectacular_settings.GET_LIB_DOC_EXCLUDES()
-    )
-    for cls in obj.__mro__[:lib_barrier]:
+    # walk the MRO once and stop at the first library class (barrier)
+    lib_excludes = set(spectacular_settings.GET_LIB_DOC_EXCLUDES())
+    for cls in obj.__mro__:
+        if cls in lib_excludes:
+            break
         if cls.__doc__:
             return post_cleanup(inspect.cleandoc(cls.__doc__))
     return ''
@@ -291,20 +293,41 @@ def build_generic_type():
         return {'type': 'object', 'additionalProperties': {}}
 
 
+@cache
+def get_basic_type_mapping():
+    """ flattened lookup table of read-only schema templates for OpenApiTypes and python types """
+    openapi_type_mapping = {
+        k: v if v is None else types.MappingProxyType(v)
+        for k, v in get_openapi_type_mapping().items()
+    }
+    return types.MappingProxyType({
+        **{k: openapi_type_mapping[v] for k, v in PYTHON_TYPE_MAPPING.items()},
+        **openapi_type_mapping,
+    })
+
+
 def build_basic_type(obj: Union[_KnownPythonTypes, OpenApiTypes]) -> Optional[_SchemaType]:
     """
     resolve either enum or actual type and yield schema template for modification
     """
-    openapi_type_mapping = get_openapi_type_mapping()
+    template = build_basic_type_const(obj)
+    return None if template is None else template.copy()
+
+
+def build_basic_type_const(
+        obj: Union[_KnownPythonTypes, OpenApiTypes]
+) -> Optional['types.MappingProxyType[str, Any]']:
+    """
+    same as build_basic_type() but yields the shared read-only template. avoids
+    the copy when the schema is merely read, e.g. merged into another schema.
+    """
     if obj is None or type(obj) is None or obj is OpenApiTypes.NONE:
         return None
-    elif obj in openapi_type_mapping:
-        return dict(openapi_type_mapping[obj])
-    elif obj in PYTHON_TYPE_MAPPING:
-        return dict(openapi_type_mapping[PYTHON_TYPE_MAPPING[obj]])
-    else:
+    template = get_basic_type_mapping().get(obj)
+    if template is None:
         warn(f'could not resolve type for "{obj}". defaulting to "string"')
-        return dict(openapi_type_mapping[OpenApiTypes.STR])
+        template = get_basic_type_mapping()[OpenApiTypes.STR]
+    return template
 
 
 def build_array_type(schema: _SchemaType, min_length=None, max_length=None) -> _SchemaType:
@@ -420,33 +443,39 @@ def build_parameter_type(
     return schema
 
 
+# first match wins. `number` includes `integer`.
+# Ref: https://tools.ietf.org/html/draft-wright-json-schema-validation-00#section-5.21
+CHOICE_SCHEMA_TYPES: Tuple[Tuple[str, Any], ...] = (
+    ('boolean', bool),
+    ('integer', int),
+    ('number', (int, float, Decimal)),
+    ('string', str),
+)
+
+
 def build_choice_field(field) -> _SchemaType:
-    choices = list(OrderedDict.fromkeys(field.choices))  # preserve order and remove duplicates
-
-    if field.allow_blank and '' not in choices:
-        choices.append('')
-
-    if not choices:
-        type = None
-    elif all(isinstance(choice, bool) for choice in choices):
-        type = 'boolean'
-    elif all(isinstance(choice, int) for choice in choices):
-        type = 'integer'
-    elif all(isinstance(choice, (int, float, Decimal)) for choice in choices):  # `number` includes `integer`
-        # Ref: https://tools.ietf.org/html/draft-wright-json-schema-validation-00#section-5.21
-        type = 'number'
-    elif all(isinstance(choice, str) for choice in choices):
-        type = 'string'
-    else:
-        type = None
+    # preserve order and remove duplicates. keeping the keys of a dict until the
+    # very end also makes the blank/null membership checks constant time.
+    choices = dict.fromkeys(field.choices)
+
+    if field.allow_blank:
+        choices.setdefault('')
+
+    # only look at each distinct type once instead of testing every choice per candidate
+    choice_types = {choice.__class__ for choice in choices}
+    type = None
+    for schema_type, bases in CHOICE_SCHEMA_TYPES:
+        if choice_types and all(issubclass(t, bases) for t in choice_types):
+            type = schema_type
+            break
 
-    if field.allow_null and None not in choices:
-        choices.append(None)
+    if field.allow_null:
+        choices.setdefault(None)
 
     schema: _SchemaType = {
         # The value of `enum` keyword MUST be an array and SHOULD be unique.
         # Ref: https://tools.ietf.org/html/draft-wright-json-schema-validation-00#section-5.20
-        'enum': choices
+        'enum': list(choices)
     }
 
     # If We figured out `type` then and only then we should set it. It must be a string.
@@ -572,7 +601,7 @@ def append_meta(schema: _SchemaType, meta: _SchemaType) -> _SchemaType:
     return safe_ref({**schema, **meta})
 
 
-def _follow_field_source(model, path: List[str]):
+def _follow_field_source(model, path: Sequence[str]):
     """
         navigate through root model via given navigation path. supports forward/reverse relations.
     """
@@ -655,7 +684,7 @@ def follow_field_source(model, path, default=None, emit_warnings=True):
     :return: models.Field or function object
     """
     try:
-        return _follow_field_source(model, path)
+        return _follow_field_source_cached(model, tuple(path))
     except UnableToProceedError as e:
         if emit_warnings:
             warn(e)
@@ -672,6 +701,12 @@ def follow_field_source(model, path, default=None, emit_warnings=True):
     return default or dummy_property
 
 
+@functools.lru_cache(maxsize=4096)
+def _follow_field_source_cached(model, path: Tuple[str, ...]):
+    """ sources are resolved once per field and view. cache is reset with each schema generation """
+    return _follow_field_source(model, path)
+
+
 def follow_model_field_lookup(model, lookup):
     """
     Follow a model lookup `foreignkey__foreignkey__field` in the same
@@ -716,6 +751,9 @@ class ResolvedComponent:
     # OpenAPI 3.1.0+
     PATH_ITEM = 'pathItems'
 
+    # instantiated for every serializer/enum/etc. encounter during generation
+    __slots__ = ('name', 'type', 'schema', 'object')
+
     def __init__(self, name, type, schema=None, object=None):
         self.name = name
         self.type = type
@@ -737,6 +775,8 @@ class ResolvedComponent:
 
 class ComponentIdentity:
     """ A container class to make object/component comparison explicit """
+    __slots__ = ('obj',)
+
     def __init__(self, obj):
         self.obj = obj
 
@@ -1114,49 +1154,52 @@ def modify_media_types_for_versioning(view, media_types: List[str]) -> List[str]
     ]
 
 
+_NAMED_REGEX_TOKEN_RE = re.compile(
+    r'(?P<escape>\\.)'
+    r'|(?P<group_name>\(\?P<(?P<name>[^>]+)>)'
+    r'|(?P<group_open>\()'
+    r'|(?P<group_close>\))'
+    r'|(?P<class_open>\[\^?\]?)'  # a leading "]" is a literal and does not close the class
+    r'|(?P<class_close>\])',
+    re.DOTALL,
+)
+
+
 def analyze_named_regex_pattern(path: str) -> Dict[str, str]:
     """ safely extract named groups and their pattern from given regex pattern """
-    result = {}
-    stack = 0
-    name_capture, name_buffer = False, ''
-    regex_capture, regex_buffer = False, ''
-    i = 0
-    while i < len(path):
-        # estimate state at position i
-        skip = False
-        if path[i] == '\\':
-            ff = 2
-        elif path[i:i + 4] == '(?P<':
-            skip = True
-            name_capture = True
-            ff = 4
-        elif path[i] in '(' and regex_capture:
+    return dict(_analyze_named_regex_pattern(path))
+
+
+@functools.lru_cache(maxsize=1000)
+def _analyze_named_regex_pattern(path: str) -> Tuple[Tuple[str, str], ...]:
+    """ the same path regex is analyzed for every parameter of every operation on it """
+    result: Dict[str, str] = {}
+    name, start, stack, in_class = None, 0, 0, False
+    # only the structurally relevant tokens are visited. everything in between is
+    # skipped by the regex engine and later recovered by slicing the original path.
+    for match in _NAMED_REGEX_TOKEN_RE.finditer(path):
+        token = match.lastgroup
+        if token == 'escape':
+            continue
+        elif in_class:
+            # parenthesis and brackets are literals within a character class
+            if token == 'class_close' or (token == 'class_open' and match.group().endswith(']')):
+                in_class = False
+        elif token == 'class_open':
+            in_class = True
+        elif name is None:
+            if token == 'group_name':
+                name, start = match.group('name'), match.end()
+        elif token in ('group_name', 'group_open'):
             stack += 1
-            ff = 1
-        elif path[i] == '>' and name_capture:
-            assert name_buffer
-            name_capture = False
-            regex_capture = True
-            skip = True
-            ff = 1
-        elif path[i] in ')' and regex_capture:
+        elif token == 'group_close':
             if not stack:
-                regex_capture = False
-                result[name_buffer] = regex_buffer
-                name_buffer, regex_buffer = '', ''
+                result[name] = path[start:match.start()]
+                name = None
             else:
                 stack -= 1
-            ff = 1
-        else:
-            ff = 1
-        # fill buffer based on state
-        if name_capture and not skip:
-            name_buffer += path[i:i + ff]
-        elif regex_capture and not skip:
-            regex_buffer += path[i:i + ff]
-        i += ff
     assert not stack
-    return result
+    return tuple(result.items())
 
 
 @cache
@@ -1289,9 +1332,13 @@ def build_mock_request(method, path, view, original_request, **kwargs):
 def set_query_parameters(url, **kwargs) -> str:
     """ deconstruct url, safely attach query parameters in kwargs, and serialize again """
     url = str(url)  # Force evaluation of reverse_lazy urls
+    kwargs = {k: v for k, v in kwargs.items() if v is not None}
+    if '?' not in url and '#' not in url:
+        # nothing to merge with or to append to, so skip the deconstruction roundtrip
+        return f'{url}?{urllib.parse.urlencode(kwargs, doseq=True)}' if kwargs else url
     scheme, netloc, path, params, query, fragment = urllib.parse.urlparse(url)
     query = urllib.parse.parse_qs(query)
-    query.update({k: v for k, v in kwargs.items() if v is not None})
+    query.update(kwargs)
     query = urllib.parse.urlencode(query, doseq=True)
     return urllib.parse.urlunparse((scheme, netloc, path, params, query, fragment))
 
@@ -1381,13 +1428,13 @@ def resolve_type_hint(hint):
         # behaves slightly different w.r.t. __origin__
         schema = {'enum': list(args)}
         if all(type(args[0]) is type(choice) for choice in args):
-            schema.update(build_basic_type(type(args[0])))
+            schema.update(build_basic_type_const(type(args[0])))
         return schema
     elif inspect.isclass(hint) and issubclass(hint, Enum):
         schema = {'enum': [item.value for item in hint]}
         mixin_base_types = [t for t in hint.__mro__ if is_basic_type(t)]
         if mixin_base_types:
-            schema.update(build_basic_type(mixin_base_types[0]))
+            schema.update(build_basic_type_const(mixin_base_types[0]))
         return schema
     elif isinstance(hint, TYPED_DICT_META_TYPES):
         return _resolve_typeddict(hint)
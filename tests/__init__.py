@@ -61,6 +61,15 @@ def assert_equal(actual, expected):
     assert actual == expected and not diff, diff
 
 
+def deep_equal_ordered(a, b):
+    """ structural equality that, like comparing JSON dumps, also respects key order and types """
+    if isinstance(a, dict) and isinstance(b, dict):
+        return list(a) == list(b) and all(deep_equal_ordered(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(deep_equal_ordered(x, y) for x, y in zip(a, b))
+    return type(a) is type(b) and a == b
+
+
 def generate_schema(route, viewset=None, view=None, view_function=None, patterns=None):
     from django.urls import path
     from rest_framework import routers
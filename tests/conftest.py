@@ -185,12 +185,19 @@ def clear_generator_settings():
 
 @pytest.fixture()
 def clear_caches():
-    from drf_spectacular.plumbing import _load_enum_name_overrides, get_openapi_type_mapping
+    from drf_spectacular.plumbing import (
+        _follow_field_source_cached, _load_enum_name_overrides, get_basic_type_mapping,
+        get_openapi_type_mapping,
+    )
     _load_enum_name_overrides.cache_clear()
     get_openapi_type_mapping.cache_clear()
+    get_basic_type_mapping.cache_clear()
+    _follow_field_source_cached.cache_clear()
     yield
     _load_enum_name_overrides.cache_clear()
     get_openapi_type_mapping.cache_clear()
+    get_basic_type_mapping.cache_clear()
+    _follow_field_source_cached.cache_clear()
 
 
 def module_available(module_str):
@@ -1,10 +1,11 @@
 import collections
-import json
+import itertools
 import re
 import sys
 import typing
 from datetime import datetime
 from enum import Enum
+from unittest import mock
 
 if sys.version_info >= (3, 8):
     from typing import TypedDict
@@ -18,14 +19,14 @@ from django.urls import include, path
 from django.utils.functional import lazystr
 from rest_framework import generics, serializers
 
+from drf_spectacular.drainage import GENERATOR_STATS
 from drf_spectacular.openapi import AutoSchema
 from drf_spectacular.plumbing import (
     analyze_named_regex_pattern, build_basic_type, build_choice_field, detype_pattern,
     follow_field_source, force_instance, get_doc, get_list_serializer, get_relative_url, is_field,
     is_serializer, resolve_type_hint, safe_ref, set_query_parameters,
 )
-from drf_spectacular.validation import validate_schema
-from tests import generate_schema
+from tests import deep_equal_ordered, generate_schema
 
 
 def test_get_list_serializer_preserves_context():
@@ -62,19 +63,22 @@ def test_force_instance():
     assert force_instance(dict) == dict
 
 
-def test_follow_field_source_forward_reverse(no_warnings):
-    class FFS1(models.Model):
-        id = models.UUIDField(primary_key=True)
-        field_bool = models.BooleanField()
+class FFS1(models.Model):
+    id = models.UUIDField(primary_key=True)
+    field_bool = models.BooleanField()
+
+
+class FFS2(models.Model):
+    ffs1 = models.ForeignKey(FFS1, on_delete=models.PROTECT)
+
 
-    class FFS2(models.Model):
-        ffs1 = models.ForeignKey(FFS1, on_delete=models.PROTECT)
+class FFS3(models.Model):
+    id = models.CharField(primary_key=True, max_length=3)
+    ffs2 = models.ForeignKey(FFS2, on_delete=models.PROTECT)
+    field_float = models.FloatField()
 
-    class FFS3(models.Model):
-        id = models.CharField(primary_key=True, max_length=3)
-        ffs2 = models.ForeignKey(FFS2, on_delete=models.PROTECT)
-        field_float = models.FloatField()
 
+def test_follow_field_source_forward_reverse(no_warnings):
     forward_field = follow_field_source(FFS3, ['ffs2', 'ffs1', 'field_bool'])
     reverse_field = follow_field_source(FFS1, ['ffs2', 'ffs3', 'field_float'])
     forward_model = follow_field_source(FFS3, ['ffs2', 'ffs1'])
@@ -98,7 +102,9 @@ def test_detype_patterns_with_module_includes(no_warnings):
     )
 
 
-NamedTupleA = collections.namedtuple("NamedTupleA", "a, b")
+class NamedTupleA(typing.NamedTuple):
+    a: typing.Any
+    b: typing.Any
 
 
 class NamedTupleB(typing.NamedTuple):
@@ -106,6 +112,10 @@ class NamedTupleB(typing.NamedTuple):
     b: str
 
 
+# without annotations, all fields resolve to "any"
+NamedTupleC = collections.namedtuple("NamedTupleC", "a, b")
+
+
 class LanguageEnum(str, Enum):
     EN = 'en'
     DE = 'de'
@@ -128,7 +138,7 @@ class TD2(TypedDict):
     bar: typing.Dict[str, int]
 
 
-TYPE_HINT_TEST_PARAMS = [
+_BASE_PARAMS = (
     (
         typing.Optional[int],
         {'type': 'integer', 'nullable': True}
@@ -184,159 +194,176 @@ TYPE_HINT_TEST_PARAMS = [
             'properties': {'a': {'type': 'integer'}, 'b': {'type': 'string'}},
             'required': ['a', 'b']
         }
-    )
-]
+    ), (
+        typing.Iterable[NamedTupleA],
+        {
+            'type': 'array',
+            'items': {'type': 'object', 'properties': {'a': {}, 'b': {}}, 'required': ['a', 'b']}
+        }
+    ), (
+        typing.Iterable[NamedTupleC],
+        {
+            'type': 'array',
+            'items': {'type': 'object', 'properties': {'a': {}, 'b': {}}, 'required': ['a', 'b']}
+        }
+    ),
+)
 
 
-if DJANGO_VERSION > '3':
-    from django.db.models.enums import TextChoices  # only available in Django>3
+def _django3_params():
+    if DJANGO_VERSION > '3':
+        from django.db.models.enums import TextChoices  # only available in Django>3
 
-    class LanguageChoices(TextChoices):
-        EN = 'en'
-        DE = 'de'
+        class LanguageChoices(TextChoices):
+            EN = 'en'
+            DE = 'de'
 
-    TYPE_HINT_TEST_PARAMS.append((
-        LanguageChoices,
-        {'enum': ['en', 'de'], 'type': 'string'}
-    ))
+        yield (
+            LanguageChoices,
+            {'enum': ['en', 'de'], 'type': 'string'}
+        )
 
-TYPE_HINT_TEST_PARAMS.append((
-    typing.Iterable[NamedTupleA],
-    {
-        'type': 'array',
-        'items': {'type': 'object', 'properties': {'a': {}, 'b': {}}, 'required': ['a', 'b']}
-    }
-))
 
-if sys.version_info >= (3, 8):
-    # Literal only works for python >= 3.8 despite typing_extensions, because it
-    # behaves slightly different w.r.t. __origin__
-    TYPE_HINT_TEST_PARAMS.append((
-        typing.Literal['x', 'y'],
-        {'enum': ['x', 'y'], 'type': 'string'}
-    ))
+def _py38_params():
+    if sys.version_info >= (3, 8):
+        # Literal only works for python >= 3.8 despite typing_extensions, because it
+        # behaves slightly different w.r.t. __origin__
+        yield (
+            typing.Literal['x', 'y'],
+            {'enum': ['x', 'y'], 'type': 'string'}
+        )
 
-    class TD3(TypedDict, total=False):
-        """a test description"""
-        a: str
-    TYPE_HINT_TEST_PARAMS.append((
-        TD3,
-        {
-            'type': 'object',
-            'description': 'a test description',
-            'properties': {
-                'a': {'type': 'string'},
+        class TD3(TypedDict, total=False):
+            """a test description"""
+            a: str
+
+        yield (
+            TD3,
+            {
+                'type': 'object',
+                'description': 'a test description',
+                'properties': {
+                    'a': {'type': 'string'},
+                }
             }
-        }
-    ))
+        )
 
-if sys.version_info >= (3, 9):
-    TYPE_HINT_TEST_PARAMS.append((
-        dict[str, int],
-        {'type': 'object', 'additionalProperties': {'type': 'integer'}}
-    ))
 
+def _py39_params():
+    if sys.version_info >= (3, 9):
+        yield (
+            dict[str, int],
+            {'type': 'object', 'additionalProperties': {'type': 'integer'}}
+        )
 
-# typing.TypedDict for py==3.8 is missing the __required_keys__ feature.
-# below that we use typing_extensions.TypedDict, which does contain it.
-if sys.version_info >= (3, 9) or sys.version_info < (3, 8):
-    class TD4Optional(TypedDict, total=False):
-        a: str
 
-    class TD4(TD4Optional):
-        """A test description2"""
-        b: bool
-    TYPE_HINT_TEST_PARAMS.append((
-        TD1,
-        {
-            'type': 'object',
-            'properties': {
-                'foo': {'type': 'integer'},
-                'bar': {'type': 'array', 'items': {'type': 'string'}}
-            },
-            'required': ['bar', 'foo']
-        }
-    ))
-    TYPE_HINT_TEST_PARAMS.append((
-        typing.List[TD2],
-        {
-            'type': 'array',
-            'items': {
+def _typed_dict_params():
+    # typing.TypedDict for py==3.8 is missing the __required_keys__ feature.
+    # below that we use typing_extensions.TypedDict, which does contain it.
+    if sys.version_info >= (3, 9) or sys.version_info < (3, 8):
+        class TD4Optional(TypedDict, total=False):
+            a: str
+
+        class TD4(TD4Optional):
+            """A test description2"""
+            b: bool
+
+        yield (
+            TD1,
+            {
                 'type': 'object',
                 'properties': {
-                    'foo': {'type': 'string'},
-                    'bar': {'type': 'object', 'additionalProperties': {'type': 'integer'}}
+                    'foo': {'type': 'integer'},
+                    'bar': {'type': 'array', 'items': {'type': 'string'}}
                 },
-                'required': ['bar', 'foo'],
+                'required': ['bar', 'foo']
             }
-        }
-    ))
-    TYPE_HINT_TEST_PARAMS.append((
-        TD4,
-        {
-            'type': 'object',
-            'description': 'A test description2',
-            'properties': {
-                'a': {'type': 'string'},
-                'b': {'type': 'boolean'}
-            },
-            'required': ['b'],
-        })
-    )
-else:
-    TYPE_HINT_TEST_PARAMS.append((
-        TD1,
-        {
-            'type': 'object',
-            'properties': {
-                'foo': {'type': 'integer'},
-                'bar': {'type': 'array', 'items': {'type': 'string'}}
-            },
-        }
-    ))
-    TYPE_HINT_TEST_PARAMS.append((
-        typing.List[TD2],
-        {
-            'type': 'array',
-            'items': {
+        )
+        yield (
+            typing.List[TD2],
+            {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'foo': {'type': 'string'},
+                        'bar': {'type': 'object', 'additionalProperties': {'type': 'integer'}}
+                    },
+                    'required': ['bar', 'foo'],
+                }
+            }
+        )
+        yield (
+            TD4,
+            {
                 'type': 'object',
+                'description': 'A test description2',
                 'properties': {
-                    'foo': {'type': 'string'},
-                    'bar': {'type': 'object', 'additionalProperties': {'type': 'integer'}}
-                }
-            },
-        }
-    ))
-# New X | Y union syntax in Python 3.10+ (PEP 604)
-if sys.version_info >= (3, 10):
-    TYPE_HINT_TEST_PARAMS.extend([
-        (
+                    'a': {'type': 'string'},
+                    'b': {'type': 'boolean'}
+                },
+                'required': ['b'],
+            }
+        )
+    else:
+        yield (
+            TD1,
+            {
+                'type': 'object',
+                'properties': {
+                    'foo': {'type': 'integer'},
+                    'bar': {'type': 'array', 'items': {'type': 'string'}}
+                },
+            }
+        )
+        yield (
+            typing.List[TD2],
+            {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'foo': {'type': 'string'},
+                        'bar': {'type': 'object', 'additionalProperties': {'type': 'integer'}}
+                    }
+                },
+            }
+        )
+
+
+def _py310_params():
+    # New X | Y union syntax in Python 3.10+ (PEP 604)
+    if sys.version_info >= (3, 10):
+        yield (
             int | None,
             {'type': 'integer', 'nullable': True}
-        ),
-        (
+        )
+        yield (
             int | str,
             {'oneOf': [{'type': 'integer'}, {'type': 'string'}]}
-        ), (
+        )
+        yield (
             int | str | None,
             {'oneOf': [{'type': 'integer'}, {'type': 'string'}], 'nullable': True}
-        ), (
+        )
+        yield (
             list[int | str],
             {"type": "array", "items": {"oneOf": [{"type": "integer"}, {"type": "string"}]}}
         )
-    ])
 
-if sys.version_info >= (3, 12):
-    exec("type MyAlias = typing.Literal['x', 'y']")
-    exec("type MyAliasNested = MyAlias | list[int | str]")
 
-    TYPE_HINT_TEST_PARAMS.extend([
-        (
-            MyAlias,  # noqa: F821
+def _py312_params():
+    if sys.version_info >= (3, 12):
+        namespace = {'typing': typing}
+        exec("type MyAlias = typing.Literal['x', 'y']", namespace)
+        exec("type MyAliasNested = MyAlias | list[int | str]", namespace)
+
+        yield (
+            namespace['MyAlias'],
             {'enum': ['x', 'y'], 'type': 'string'}
-        ),
-        (
-            MyAliasNested,  # noqa: F821
+        )
+        yield (
+            namespace['MyAliasNested'],
             {
                 'oneOf': [
                     {'enum': ['x', 'y'], 'type': 'string'},
@@ -344,30 +371,57 @@ if sys.version_info >= (3, 12):
                 ]
             }
         )
-    ])
 
 
-@pytest.mark.parametrize(['type_hint', 'ref_schema'], TYPE_HINT_TEST_PARAMS)
-def test_type_hint_extraction(no_warnings, type_hint, ref_schema):
-    def func() -> type_hint:
-        pass  # pragma: no cover
+TYPE_HINT_TEST_PARAMS = tuple(itertools.chain(
+    _BASE_PARAMS,
+    _django3_params(),
+    _py38_params(),
+    _py39_params(),
+    _typed_dict_params(),
+    _py310_params(),
+    _py312_params(),
+))
 
-    # check expected resolution
-    schema = resolve_type_hint(typing.get_type_hints(func).get('return'))
-    assert json.dumps(schema) == json.dumps(ref_schema)
 
-    # check schema validity
-    class XSerializer(serializers.Serializer):
-        x = serializers.SerializerMethodField()
-    XSerializer.get_x = func
+@pytest.fixture(scope='module')
+def type_hint_schema():
+    """ generate and validate one schema covering all type hint cases at once """
+    patterns = []
+    for i, (type_hint, _) in enumerate(TYPE_HINT_TEST_PARAMS):
+        def get_x(self, obj) -> type_hint:
+            pass  # pragma: no cover
+
+        serializer = type(f'X{i}Serializer', (serializers.Serializer,), {
+            'x': serializers.SerializerMethodField(),
+            'get_x': get_x,
+        })
+        view = type(f'X{i}View', (generics.RetrieveAPIView,), {'serializer_class': serializer})
+        patterns.append(path(f'x{i}/', view.as_view()))
 
-    class XView(generics.RetrieveAPIView):
-        serializer_class = XSerializer
+    # the enum postprocessing would merge and rename the enums shared by multiple cases
+    with mock.patch('drf_spectacular.settings.spectacular_settings.POSTPROCESSING_HOOKS', []):
+        schema = generate_schema(None, patterns=patterns)
+    assert not GENERATOR_STATS, 'schema generation emitted warnings or errors'
+    return schema
+
+
+@pytest.mark.parametrize(
+    ['index', 'type_hint', 'ref_schema'],
+    [(i, *params) for i, params in enumerate(TYPE_HINT_TEST_PARAMS)]
+)
+def test_type_hint_extraction(no_warnings, type_hint_schema, index, type_hint, ref_schema):
+    # check expected resolution
+    schema = resolve_type_hint(type_hint)
+    assert deep_equal_ordered(schema, ref_schema), (schema, ref_schema)
 
-    validate_schema(generate_schema('/x', view=XView))
+    # check that the hint made it into the (already validated) batch schema
+    assert f'/x{index}/' in type_hint_schema['paths']
+    field_schema = type_hint_schema['components']['schemas'][f'X{index}']['properties']['x']
+    assert deep_equal_ordered({k: v for k, v in field_schema.items() if k != 'readOnly'}, ref_schema)
 
 
-@pytest.mark.parametrize(['pattern', 'output'], [
+NAMED_REGEX_TEST_PARAMS = [
     ('(?P<t1><,()(())(),)', {'t1': '<,()(())(),'}),
     (r'(?P<t1>.\\)', {'t1': r'.\\'}),
     (r'(?P<t1>.\\\\)', {'t1': r'.\\\\'}),
@@ -375,9 +429,19 @@ def test_type_hint_extraction(no_warnings, type_hint, ref_schema):
     (r'(?P<t1>)', {'t1': r''}),
     (r'(?P<t1>.[\(]{2})', {'t1': r'.[\(]{2}'}),
     (r'(?P<t1>(.))/\(t/(?P<t2>\){2}()\({2}().*)', {'t1': '(.)', 't2': r'\){2}()\({2}().*'}),
-])
+    (r'(?P<t1>[()])', {'t1': '[()]'}),
+    (r'(?P<t1>[](])/(?P<t2>[^]()]+)', {'t1': '[](]', 't2': '[^]()]+'}),
+]
+
+
+def test_named_regex_patterns_validity():
+    # analyze_named_regex_pattern is lenient, so make sure the inputs are proper regexes
+    for pattern, _ in NAMED_REGEX_TEST_PARAMS:
+        re.compile(pattern)
+
+
+@pytest.mark.parametrize(['pattern', 'output'], NAMED_REGEX_TEST_PARAMS)
 def test_analyze_named_regex_pattern(no_warnings, pattern, output):
-    re.compile(pattern)  # check validity of regex
     assert analyze_named_regex_pattern(pattern) == output
 
 
@@ -454,6 +518,16 @@ def test_url_tooling_with_lazy_url():
     assert set_query_parameters(lazystr(some_url), foo=123) == some_url + "?foo=123"
 
 
+def test_set_query_parameters():
+    some_url = "http://api.example.org/accounts/"
+
+    assert set_query_parameters(some_url) == some_url
+    assert set_query_parameters(some_url, foo=None) == some_url
+    assert set_query_parameters(some_url, foo=[1, 2]) == some_url + "?foo=1&foo=2"
+    assert set_query_parameters(some_url + "?foo=1&bar=2", foo=3) == some_url + "?foo=3&bar=2"
+    assert set_query_parameters(some_url + "#frag", foo=1) == some_url + "?foo=1#frag"
+
+
 def test_get_doc():
     T = typing.TypeVar('T')
 
@@ -462,3 +536,11 @@ def test_get_doc():
 
     doc = get_doc(MyClass)
     assert doc == ""
+
+    class MyDocumentedClass(MyClass):
+        """ my doc """
+
+    class MySubClass(MyDocumentedClass):
+        pass
+
+    assert get_doc(MySubClass) == "my doc"
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Tuple, Union
 from unittest import mock
 
 import pytest
@@ -245,6 +245,38 @@ def test_unable_to_traverse_union_type_hint(capsys):
     assert 'Bar' in stderr
 
 
+def test_unresolvable_type_hint_warns_for_every_view(capsys):
+    class Foo:
+        pass
+
+    class S1(serializers.Serializer):
+        x = serializers.SerializerMethodField()
+
+        def get_x(self, obj) -> Tuple[Foo, Foo]:  # type: ignore
+            pass  # pragma: no cover
+
+    class S2(serializers.Serializer):
+        x = serializers.SerializerMethodField()
+
+        def get_x(self, obj) -> Tuple[Foo, Foo]:  # type: ignore
+            pass  # pragma: no cover
+
+    class V1(APIView):
+        @extend_schema(responses=S1)
+        def get(self, request):
+            pass  # pragma: no cover
+
+    class V2(APIView):
+        @extend_schema(responses=S2)
+        def get(self, request):
+            pass  # pragma: no cover
+
+    generate_schema(None, patterns=[path('v1', V1.as_view()), path('v2', V2.as_view())])
+    stderr = capsys.readouterr().err
+    assert '[V1 > S1]: could not resolve type for "' in stderr
+    assert '[V2 > S2]: could not resolve type for "' in stderr
+
+
 def test_operation_id_collision_resolution(capsys):
     @extend_schema(responses=OpenApiTypes.FLOAT)
     @api_view(['GET'])